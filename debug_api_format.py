@@ -8,18 +8,21 @@ import requests
 import json
 
 API_BASE = "http://localhost:8000"
+LOCAL_TIMEOUT = (0.5, 2.0)  # (connect, read) seconds - fail fast against a local server
 
 # Test what the API actually returns
 try:
-    # Create session
-    response = requests.post(f"{API_BASE}/api/statement-processor")
-    session_data = response.json()
-    session_id = session_data['session_id']
-    print("✅ Session created:", session_id)
+    # One Session keeps both calls on the same kept-alive connection
+    with requests.Session() as http:
+        # Create session
+        response = http.post(f"{API_BASE}/api/statement-processor", timeout=LOCAL_TIMEOUT)
+        session_id = response.json()['session_id']
+        session_url = f"{API_BASE}/api/statement-processor/{session_id}"
+        
+        # Get questions (this will be empty since no files uploaded, but shows format)
+        questions_data = http.get(session_url + "/questions", timeout=LOCAL_TIMEOUT).json()
     
-    # Get questions (this will be empty since no files uploaded, but shows format)
-    response = requests.get(f"{API_BASE}/api/statement-processor/{session_id}/questions")
-    questions_data = response.json()
+    print("✅ Session created:", session_id)
     
     print("\n📊 CURRENT API RESPONSE FORMAT:")
     print("=" * 50)
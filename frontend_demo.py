@@ -14,6 +14,7 @@ frontend_app = Flask(__name__)
 # Configuration
 API_BASE_URL = os.environ.get('API_URL', 'https://alaeautomatesapi.up.railway.app')
 LOCAL_PORT = int(os.environ.get('FRONTEND_PORT', 3000))
+LOCAL_URL = f"http://localhost:{LOCAL_PORT}"
 
 @frontend_app.route('/')
 def home():
@@ -43,16 +44,16 @@ if __name__ == '__main__':
     print("=" * 60)
     print("FRONTEND DEMO SERVER")
     print("=" * 60)
-    print(f"Frontend URL: http://localhost:{LOCAL_PORT}")
+    print(f"Frontend URL: {LOCAL_URL}")
     print(f"Backend API: {API_BASE_URL}")
     print("=" * 60)
     print("Available pages:")
-    print(f"  Home Page: http://localhost:{LOCAL_PORT}/")
-    print(f"  Monthly Statements: http://localhost:{LOCAL_PORT}/monthly-statements")
-    print(f"  Invoice Separator: http://localhost:{LOCAL_PORT}/invoice-separator")
-    print(f"  Credit Card Batch: http://localhost:{LOCAL_PORT}/credit-card-batch")
-    print(f"  Excel Formatter: http://localhost:{LOCAL_PORT}/excel-formatter")
-    print(f"  Excel Comparison: http://localhost:{LOCAL_PORT}/excel-comparison")
+    print(f"  Home Page: {LOCAL_URL}/")
+    print(f"  Monthly Statements: {LOCAL_URL}/monthly-statements")
+    print(f"  Invoice Separator: {LOCAL_URL}/invoice-separator")
+    print(f"  Credit Card Batch: {LOCAL_URL}/credit-card-batch")
+    print(f"  Excel Formatter: {LOCAL_URL}/excel-formatter")
+    print(f"  Excel Comparison: {LOCAL_URL}/excel-comparison")
     print("=" * 60)
     print("NOTE: Make sure your backend API is running on Railway!")
     print("Update API_URL environment variable to point to your Railway URL")
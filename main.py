@@ -452,7 +452,8 @@ def download_results(session_id):
         processor = StatementProcessor(pdf_path, excel_path)
         
         # Create split PDFs
-        split_results = processor.create_split_pdfs(statements)
+        split_pdfs = processor.build_split_pdfs(statements)
+        split_results = {dest: pages for dest, (_, pages) in split_pdfs.items()}
         
         # Create detailed results file content
         results_content = f"""STATEMENT PROCESSING RESULTS
@@ -503,38 +504,12 @@ Excel: {session_data['files']['excel_name']}
             # Add results file to logs folder
             zip_file.writestr('logs/processing_results.txt', results_content)
             
-            # Add statements data as JSON to logs folder
-            # Clean up internal logging data
-            for statement in statements:
-                if '_extraction_log' in statement:
-                    del statement['_extraction_log']
+            # Add statements data as JSON to logs folder (same payload as save_results)
+            zip_file.writestr('logs/processing_results.json', processor.results_json(statements))
             
-            # Create clean JSON structure for API consumers
-            data = {
-                "dnm_companies": processor.dnm_companies,
-                "extracted_statements": statements,
-                "total_statements_found": len(statements),
-                "processing_timestamp": datetime.now().isoformat()
-            }
-            
-            zip_file.writestr('logs/processing_results.json', json.dumps(data, indent=2, ensure_ascii=False))
-            
-            # Add split PDF files in root directory
-            pdf_files = {
-                "DNM": "DNM.pdf",
-                "Foreign": "Foreign.pdf", 
-                "Natio Single": "natioSingle.pdf",
-                "Natio Multi": "natioMulti.pdf"
-            }
-            
-            for dest, filename in pdf_files.items():
-                if os.path.exists(filename) and dest in split_results:
-                    zip_file.write(filename, filename)
-                    # Clean up temporary files
-                    try:
-                        os.remove(filename)
-                    except:
-                        pass
+            # Add split PDF files in root directory - built in memory and already deflated, so store as-is
+            for dest, (pdf_bytes, _) in split_pdfs.items():
+                zip_file.writestr(StatementProcessor.SPLIT_PDF_FILES[dest], pdf_bytes, compress_type=zipfile.ZIP_STORED)
         
         zip_buffer.seek(0)
         
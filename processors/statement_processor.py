@@ -9,19 +9,40 @@ Version: 3.0 - Production Ready
 """
 
 import fitz
+import argparse
 import json
 import re
 import os
 import sys
 import gc
+import faulthandler
+import hashlib
 import logging
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from difflib import SequenceMatcher
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from difflib import get_close_matches, SequenceMatcher
-from PyPDF2 import PdfReader, PdfWriter
+import rapidfuzz
+from rapidfuzz import fuzz, process
 from openpyxl import load_workbook
-from typing import Dict, List, Tuple, Optional, Set, Any
-from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Set, Any, Iterable, Iterator
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional fast JSON encoder for result files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Rust-backed Excel reader for the DNM list
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
 
 # Import the memory manager
 try:
@@ -32,6 +53,93 @@ except ImportError:
     memory_manager = None
 
 
+# Deletion table equivalent to PATTERNS['clean_text'] ([\s,.()\-_&]+): every str.isspace() code point
+# (all are below U+3001) plus the punctuation - str.translate beats the regex sub on typical names
+_CLEAN_TEXT_TABLE = str.maketrans('', '', ''.join(chr(cp) for cp in range(0x3001) if chr(cp).isspace()) + ',.()-_&')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str, suffix_pattern: re.Pattern) -> str:
+    """Memoized core of company name normalization - same names recur across pages and DNM rows."""
+    normalized = name.lower().strip()
+    normalized = suffix_pattern.sub('', normalized)
+    normalized = normalized.translate(_CLEAN_TEXT_TABLE)
+    return normalized.strip()
+
+
+def _iter_dnm_cells(excel_path: str):
+    """Yield column A of the DNM sheet, skipping the first 3 rows (2 header rows + 1 for 0-indexing)."""
+    if CALAMINE_AVAILABLE:
+        rows = CalamineWorkbook.from_path(excel_path).get_sheet_by_name('10-2018').to_python(skip_empty_area=False)
+        for row in rows[3:]:
+            cell_value = row[0] if row else None
+            # Match openpyxl's value types: int for whole numbers, datetime for date cells
+            if isinstance(cell_value, float) and cell_value.is_integer():
+                cell_value = int(cell_value)
+            elif type(cell_value) is date:
+                cell_value = datetime.combine(cell_value, datetime.min.time())
+            yield cell_value
+        return
+    
+    # Fallback: openpyxl streaming reader
+    workbook = load_workbook(excel_path, read_only=True)
+    try:
+        for row in workbook['10-2018'].iter_rows(min_row=4, max_col=1, values_only=True):
+            yield row[0]
+    finally:
+        workbook.close()
+
+
+@lru_cache(maxsize=8)
+def _read_dnm_sheet(excel_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Cleaned DNM company names, memoized per process - mtime_ns/size in the key re-read edited workbooks."""
+    companies = []
+    for cell_value in _iter_dnm_cells(excel_path):
+        if cell_value and str(cell_value).strip() and not str(cell_value).lower().startswith('name'):
+            companies.append(str(cell_value).strip())
+    return tuple(companies)
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint() -> str:
+    """Hash of this module plus the PyMuPDF and RapidFuzz versions - invalidates caches built by other code."""
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    digest.update(f"pymupdf={fitz.VersionBind};rapidfuzz={rapidfuzz.__version__}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+# Processor copy used inside pool worker processes (set once per worker by the initializer)
+_worker_processor = None
+
+
+def _init_statement_worker(processor: "StatementProcessor") -> None:
+    """Process pool initializer - ships the processor state to each worker once instead of per task."""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _process_statement_task(task: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+    """Process pool entry point for a single statement's last page."""
+    return _worker_processor._process_statement(*task)
+
+
+def _encode_json_line(obj: Any) -> bytes:
+    """Encode one record as a compact UTF-8 JSON line for NDJSON output."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def _extract_page_range_task(task: Tuple[str, int, int]) -> List[str]:
+    """Process pool entry point - extracts pages [start, stop) through the worker's own PDF handle."""
+    pdf_path, start, stop = task
+    doc = fitz.open(pdf_path)
+    try:
+        return [doc[page_idx].get_text("text", sort=False) for page_idx in range(start, stop)]
+    finally:
+        doc.close()
+
+
 class StatementProcessor:
     """
     Professional statement processor with O(n) complexity optimizations.
@@ -54,10 +162,30 @@ class StatementProcessor:
     # CRITICAL FIX: Added missing SKIP_LINES entries exactly like minimal version
     SKIP_LINES = {"Statement Date:", "Total Due:", "www.unitedcorporate.com", "Amount", "Invoice Number", "Description", "Invoice Date", "Invoice Number Description Invoice Date Amount"}
     
-    def __init__(self, pdf_path: str, excel_path: str):
-        """Initialize processor with file paths, memory system, and pre-compile patterns for O(n) performance."""
+    # Output file name per split destination, in split order
+    SPLIT_PDF_FILES = {
+        "DNM": "DNM.pdf",
+        "Foreign": "Foreign.pdf",
+        "Natio Single": "natioSingle.pdf",
+        "Natio Multi": "natioMulti.pdf"
+    }
+    
+    # Supported save_results formats - ndjson writes one statement per line
+    OUTPUT_FORMATS = ("json", "ndjson")
+    
+    # Compiled (patterns, PATTERNS) pair shared by every instance - built on first use
+    _compiled_patterns: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+    
+    def __init__(self, pdf_path: str, excel_path: str, workers: int = 1, cache_dir: Optional[str] = None):
+        """Initialize processor with file paths, memory system, and pre-compile patterns for O(n) performance.
+        
+        workers > 1 spreads page text extraction and per-statement matching across that many processes.
+        cache_dir enables on-disk caches of the parsed DNM list and of extracted statements (None = off).
+        """
         self.pdf_path = Path(pdf_path)
         self.excel_path = Path(excel_path)
+        self.workers = max(1, workers)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Validate file paths immediately
@@ -71,10 +199,17 @@ class StatementProcessor:
         
         # Load and pre-process DNM companies for O(1) lookups
         self.dnm_companies, self.normalized_company_map = self._load_dnm_companies()
+        self._dnm_company_set = frozenset(self.dnm_companies)
+        
+        # Length-sorted index over the normalized names for batch fuzzy scoring
+        self._build_match_index()
         
         # Load company memory for O(1) decision lookups
         self.company_memory = self._load_company_memory()
         
+        # Match results per extracted company name - vendors recur across statements
+        self._match_cache: Dict[str, Tuple[Optional[str], List[Dict[str, str]]]] = {}
+        
         # Cache for processed pages to avoid reprocessing
         self._processed_pages: Set[int] = set()
         
@@ -82,6 +217,14 @@ class StatementProcessor:
         gc.collect()
     
     def _compile_patterns(self) -> None:
+        """Attach the shared pre-compiled regex patterns, compiling them once per process."""
+        cls = type(self)
+        if cls._compiled_patterns is None:
+            cls._compiled_patterns = cls._build_patterns()
+        self.patterns, self.PATTERNS = cls._compiled_patterns
+    
+    @classmethod
+    def _build_patterns(cls) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Pre-compile all regex patterns for maximum performance."""
         # Use the exact same business suffix list and pattern logic as the original code
         suffixes = [
@@ -177,7 +320,7 @@ class StatementProcessor:
         # Create pattern that matches these suffixes at word boundaries
         pattern = r'\b(?:' + '|'.join(escaped_suffixes) + r')\b'
         
-        self.patterns = {
+        patterns = {
             'page': re.compile(r'Page\s*(\d+)\s*of\s*(\d+)', re.IGNORECASE),
             'total_due': re.compile(r'(.+?)\s+Total Due\s+\$', re.IGNORECASE),
             'business_suffixes': re.compile(pattern, re.IGNORECASE),
@@ -186,42 +329,70 @@ class StatementProcessor:
         }
         
         # CRITICAL FIX: Enhanced patterns for company extraction exactly like minimal version
-        self.PATTERNS = {
+        compiled = {
             'page': re.compile(r'Page\s*(\d+)\s*of\s*(\d+)', re.IGNORECASE),
             'total_due_subtotal': re.compile(r'Subtotal\s+\$[\d,]+\.\d{2}\s+([^\n\r]+?)\s+Total Due\s+\$[\d,]+\.\d{2}', re.IGNORECASE | re.MULTILINE),
             'total_due_multiline': re.compile(r'([^\n\r]+\n[^\n\r]*?)\s+Total Due\s+\$[\d,]+\.\d{2}', re.IGNORECASE | re.MULTILINE),
             'total_due_line': re.compile(r'(\S[^\n\r]*?)\s+Total Due\s+\$[\d,]+\.\d{2}', re.IGNORECASE | re.MULTILINE),
+            'total_due_amount': re.compile(r'Total Due\s+\$[\d,]+\.\d{2}', re.IGNORECASE),
             'business_suffix': re.compile(r'\b(?:inc|incorporated|corp|corporation|llc|ltd|limited|llp|lp|pc|pa|pllc|plc|co|company|companies|enterprise|enterprises|group|groups|holding|holdings|international|intl|global|solutions|services|systems|technologies|tech|industries|foundation|trust|association|society|institute|center|centre|organization|org)\b', re.IGNORECASE),
             'clean_text': re.compile(r'[\s,.()\-_&]+'),
-            'whitespace': re.compile(r'\s+')
+            'whitespace': re.compile(r'\s+'),
+            # State code delimited by spaces or text boundaries - one scan instead of one per state
+            'us_states': re.compile(r'(?<![^ ])(?:' + '|'.join(sorted(cls.US_STATES)) + r')(?![^ ])', re.IGNORECASE),
+            'email_marker': re.compile(r'email', re.IGNORECASE),
+            # Leftmost occurrence of any start marker in a single scan
+            'start_markers': re.compile('|'.join(re.escape(marker) for marker in cls.START_MARKERS)),
+            # Any SKIP_LINES fragment, tested once per line instead of one `in` per fragment
+            'skip_lines': re.compile('|'.join(re.escape(skip) for skip in sorted(cls.SKIP_LINES)))
         }
+        return patterns, compiled
     
     def _normalize_company_name(self, name: str) -> str:
         """Normalize company names for consistent matching - O(1) operation."""
         if not name:
             return ""
         
-        normalized = str(name).lower().strip()
-        normalized = self.PATTERNS['business_suffix'].sub('', normalized)
-        normalized = self.PATTERNS['clean_text'].sub('', normalized)
+        return _normalize_name(str(name), self.PATTERNS['business_suffix'])
+    
+    def _read_dnm_list(self) -> List[str]:
+        """Read the DNM company names, via the JSON cache in cache_dir or the in-process sheet cache when current."""
+        stat = self.excel_path.stat()
+        resolved_path = str(self.excel_path.resolve())
+        cache_path = None
+        if self.cache_dir is not None:
+            path_key = hashlib.blake2b(resolved_path.encode('utf-8'), digest_size=16).hexdigest()
+            cache_path = self.cache_dir / f"dnm_{path_key}.json"
+            try:
+                cached = json.loads(cache_path.read_bytes())
+                if (cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size
+                        and cached['code'] == _code_fingerprint()):
+                    return cached['companies']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # Missing or stale cache - re-read the workbook
+        
+        companies = list(_read_dnm_sheet(resolved_path, stat.st_mtime_ns, stat.st_size))
+        
+        if cache_path is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                tmp_path.write_text(json.dumps({
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'code': _code_fingerprint(),
+                    'companies': companies
+                }, ensure_ascii=False), encoding='utf-8')
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                self.logger.warning("Could not write DNM cache %s: %s", cache_path, e)
         
-        return normalized.strip()
+        return companies
     
     def _load_dnm_companies(self) -> Tuple[List[str], Dict[str, str]]:
         """Load and pre-process DNM companies for O(1) lookups."""
         try:
-            # Load Excel file with openpyxl instead of pandas
-            workbook = load_workbook(self.excel_path, read_only=True)
-            worksheet = workbook['10-2018']
-            
-            companies = []
-            # Skip first 3 rows (2 header rows + 1 for 0-indexing)
-            for row in worksheet.iter_rows(min_row=4, max_col=1, values_only=True):
-                cell_value = row[0]
-                if cell_value and str(cell_value).strip() and not str(cell_value).lower().startswith('name'):
-                    companies.append(str(cell_value).strip())
-            
-            workbook.close()
+            companies = self._read_dnm_list()
             
             # Create normalized mapping for O(1) lookups
             normalized_map = {}
@@ -235,6 +406,15 @@ class StatementProcessor:
         except Exception as e:
             raise RuntimeError(f"Failed to load DNM companies: {e}")
     
+    def _build_match_index(self) -> None:
+        """Build index-aligned lists of normalized DNM names sorted by length for band-limited scoring."""
+        # (length, load position, key) - ties keep the DNM list order used to rank equal scores
+        by_length = sorted((len(key), position, key) for position, key in enumerate(self.normalized_company_map))
+        self._norm_lengths = [length for length, _, _ in by_length]
+        self._norm_positions = [position for _, position, _ in by_length]
+        self._norm_keys = [key for _, _, key in by_length]
+        self._norm_originals = [self.normalized_company_map[key] for key in self._norm_keys]
+    
     def _load_company_memory(self) -> Dict[str, Dict[str, bool]]:
         """Load company memory for O(1) decision lookups during processing."""
         if not MEMORY_AVAILABLE or not memory_manager:
@@ -264,9 +444,19 @@ class StatementProcessor:
             return {}
     
     def _find_company_match(self, company_name: str) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """Find company match, reusing the result when the same company recurs in the PDF."""
+        cached = self._match_cache.get(company_name)
+        if cached is None:
+            cached = self._match_cache[company_name] = self._score_company_match(company_name)
+        
+        # Hand out fresh match dicts so statements never share mutable state
+        exact_match, similar_matches = cached
+        return exact_match, [dict(match) for match in similar_matches]
+    
+    def _score_company_match(self, company_name: str) -> Tuple[Optional[str], List[Dict[str, str]]]:
         """Find company match with O(1) exact match, memory-enhanced matching, and fuzzy matching."""
         # O(1) exact match check
-        if company_name in self.dnm_companies:
+        if company_name in self._dnm_company_set:
             return company_name, []
         
         # O(1) normalized exact match
@@ -279,36 +469,50 @@ class StatementProcessor:
         
         # Enhanced fuzzy matching: Check ALL companies above 50% threshold
         similar_matches = []
-        confirmed_match = None
         
         if normalized:
-            for norm_company, original_company in self.normalized_company_map.items():
-                similarity_score = SequenceMatcher(None, normalized, norm_company).ratio() * 100
+            # Both ratios are 2*matches/(len_a+len_b), so a 50% score needs len/3 <= candidate length <= 3*len
+            length = len(normalized)
+            lo = bisect_left(self._norm_lengths, (length + 2) // 3)
+            hi = bisect_right(self._norm_lengths, 3 * length)
+            
+            # Pre-filter the band in one C++ batch call: fuzz.ratio (2*LCS/total) is never below
+            # SequenceMatcher's ratio, so every candidate the exact score would keep survives
+            candidates = process.extract(normalized, self._norm_keys[lo:hi], scorer=fuzz.ratio,
+                                         score_cutoff=50.0, limit=None)
+            
+            # Rescore survivors with the matching metric itself so scores and percentages are unchanged
+            scored = []
+            for key, _, idx in candidates:
+                similarity_score = SequenceMatcher(None, normalized, key).ratio() * 100
                 if similarity_score >= 50.0:
-                    
-                    # Check if we have a stored decision for this company pair
-                    if original_company in stored_decisions:
-                        user_decision = stored_decisions[original_company]
-                        if user_decision:  # User previously said "yes" - same company
-                            confirmed_match = original_company
-                            self.logger.info(f"Memory: Auto-confirmed {company_name} = {original_company} (previously answered: yes)")
-                            break  # Found a confirmed match, no need to continue
-                        else:  # User previously said "no" - different company
-                            self.logger.info(f"Memory: Auto-rejected {company_name} ≠ {original_company} (previously answered: no)")
-                            continue  # Skip this match, user already said it's different
-                    
-                    # No stored decision - add to questions
-                    similar_matches.append({
-                        "company_name": original_company,
-                        "percentage": f"{round(similarity_score, 1)}%"
-                    })
+                    scored.append((key, similarity_score, idx))
             
-            # Sort by similarity score (highest first)
-            similar_matches.sort(key=lambda x: float(x["percentage"].replace('%', '')), reverse=True)
-        
-        # If we found a confirmed match from memory, return it
-        if confirmed_match:
-            return confirmed_match, []
+            # Highest displayed percentage first, ties in DNM list order
+            scored.sort(key=lambda hit: (-round(hit[1], 1), self._norm_positions[lo + hit[2]]))
+            
+            # A stored "yes" wins regardless of score; with several, the first in DNM list order is confirmed
+            if stored_decisions:
+                confirmed = [(self._norm_positions[lo + idx], self._norm_originals[lo + idx]) for _, _, idx in scored
+                             if stored_decisions.get(self._norm_originals[lo + idx])]
+                if confirmed:
+                    confirmed_match = min(confirmed)[1]
+                    self.logger.info("Memory: Auto-confirmed %s = %s (previously answered: yes)", company_name, confirmed_match)
+                    return confirmed_match, []
+            
+            for _, similarity_score, idx in scored:
+                original_company = self._norm_originals[lo + idx]
+                
+                # Check if we have a stored decision for this company pair - only "no" answers remain here
+                if original_company in stored_decisions:
+                    self.logger.info("Memory: Auto-rejected %s ≠ %s (previously answered: no)", company_name, original_company)
+                    continue  # Skip this match, user already said it's different
+                
+                # No stored decision - add to questions
+                similar_matches.append({
+                    "company_name": original_company,
+                    "percentage": f"{round(similarity_score, 1)}%"
+                })
         
         return None, similar_matches
     
@@ -333,6 +537,7 @@ class StatementProcessor:
                 if extracted_company not in self.company_memory:
                     self.company_memory[extracted_company] = {}
                 self.company_memory[extracted_company][dnm_company] = user_decision
+                self._match_cache.pop(extracted_company, None)
                 
                 self.logger.info(f"Stored answer in memory: {extracted_company} vs {dnm_company} = {user_decision}")
             
@@ -343,9 +548,8 @@ class StatementProcessor:
             return False
     
     def _detect_location(self, text: str) -> str:
-        """Detect location using optimized state detection - O(k) where k = 50 states."""
-        text_upper = f" {text.upper()} "
-        return "National" if any(f" {state} " in text_upper for state in self.US_STATES) else "Foreign"
+        """Detect location using a single compiled state-code scan - O(n) in text length."""
+        return "National" if self.PATTERNS['us_states'].search(text) else "Foreign"
     
     def _determine_destination(self, exact_match: Optional[str], text: str, location: str, 
                             pages: int, best_percentage: float, has_email: bool) -> str:
@@ -357,21 +561,24 @@ class StatementProcessor:
         else:
             return "Natio Single" if pages == 1 else "Natio Multi"
     
+    def _find_boundaries(self, text: str) -> Tuple[int, int]:
+        """Locate the first start marker and the end marker - one pass each, -1 when missing."""
+        start_match = self.PATTERNS['start_markers'].search(text)
+        return (start_match.start() if start_match else -1), text.find(self.END_MARKER)
+    
     def _process_statement(self, text: str, page_num: int) -> Optional[Dict[str, Any]]:
         """CRITICAL FIX: Process statement exactly like minimal version."""
         page_match = self.PATTERNS['page'].search(text)
         current_page, total_pages = (int(page_match.group(1)), int(page_match.group(2))) if page_match else (1, 1)
         
-        start_pos = min((text.find(marker) for marker in self.START_MARKERS if marker in text), default=-1)
-        end_pos = text.find(self.END_MARKER)
+        start_pos, end_pos = self._find_boundaries(text)
         if start_pos == -1 or end_pos == -1:
             return None
         
-        content = text[start_pos:end_pos]
-        for marker in self.START_MARKERS:
-            content = content.replace(marker, '')
+        content = self.PATTERNS['start_markers'].sub('', text[start_pos:end_pos])
         
-        lines = [line.strip() for line in content.splitlines() if line.strip() and not any(skip in line for skip in self.SKIP_LINES)]
+        skip_lines = self.PATTERNS['skip_lines']
+        lines = [line for line in map(str.strip, content.splitlines()) if line and not skip_lines.search(line)]
         if not lines:
             return None
         
@@ -379,14 +586,18 @@ class StatementProcessor:
         fallback_company = lines[0].strip()
         extraction_method, fallback_used, fallback_reason = "unknown", False, ""
         
-        match = self.PATTERNS['total_due_subtotal'].search(text)
+        # Every company pattern ends in "Total Due $x.xx" - one cheap scan decides if any can match.
+        # Patterns stay separate: subtotal > multiline > line priority is not leftmost-match order.
+        has_total_due = self.PATTERNS['total_due_amount'].search(text) is not None
+        
+        match = has_total_due and self.PATTERNS['total_due_subtotal'].search(text)
         if match:
             company = self.PATTERNS['whitespace'].sub(' ', match.group(1).strip()).strip()
             if company.startswith("Amount "):
                 company = company[7:].strip()
             extraction_method = "subtotal_pattern"
         else:
-            match = self.PATTERNS['total_due_multiline'].search(text)
+            match = has_total_due and self.PATTERNS['total_due_multiline'].search(text)
             if match:
                 company = self.PATTERNS['whitespace'].sub(' ', match.group(1).replace('\n', ' ').strip()).strip()
                 if company.startswith("Amount "):
@@ -401,7 +612,7 @@ class StatementProcessor:
                     if len(company) > 100:
                         company, extraction_method, fallback_used, fallback_reason = fallback_company, "fallback", True, "Pattern extracted text too long"
             else:
-                match = self.PATTERNS['total_due_line'].search(text)
+                match = has_total_due and self.PATTERNS['total_due_line'].search(text)
                 if match:
                     company = self.PATTERNS['whitespace'].sub(' ', match.group(1).strip()).strip()
                     if company.startswith("Amount "):
@@ -427,9 +638,7 @@ class StatementProcessor:
             page_range, first_page = "-".join(map(str, range(start_page, start_page + total_pages))), start_page
         
         # Determine processing flags - ask about ALL similar matches
-        has_email = "email" in rest_text.lower()
-        best_match = similar_matches[0] if similar_matches else None
-        best_percentage = float(best_match["percentage"].replace('%', '')) if best_match else 0
+        has_email = self.PATTERNS['email_marker'].search(rest_text) is not None
         
         manual_required, ask_question = False, False
         if not (has_email or exact_match):
@@ -449,72 +658,177 @@ class StatementProcessor:
                                   company in self.company_memory and 
                                   any(decision for decision in self.company_memory[company].values()))
         
-        # CRITICAL FIX: Use OrderedDict with exact field ordering like minimal
-        result = OrderedDict()
-        result["company_name"] = company
+        # CRITICAL FIX: Exact field ordering like minimal (plain dicts keep insertion order)
+        result = {"company_name": company}
         if company.strip() != fallback_company.strip():
             result["unusedCompanyName"] = fallback_company
-        result["exact_match"] = exact_match
-        result["similar_matches"] = similar_matches
-        result["manual_required"] = manual_required
-        result["ask_question"] = ask_question
-        result["memory_decision_applied"] = memory_decision_applied  # Track memory usage
-        result["rest_of_lines"] = rest_text
-        result["location"] = location
-        result["paging"] = f"page {current_page} of {total_pages}"
-        result["number_of_pages"] = str(total_pages)
-        result["page_number_in_uploaded_pdf"] = page_range
-        result["first_page_number"] = first_page
-        result["destination"] = destination
-        result["extraction_method"] = extraction_method
-        result["fallbackUsed"] = fallback_used
+        result.update({
+            "exact_match": exact_match,
+            "similar_matches": similar_matches,
+            "manual_required": manual_required,
+            "ask_question": ask_question,
+            "memory_decision_applied": memory_decision_applied,  # Track memory usage
+            "rest_of_lines": rest_text,
+            "location": location,
+            "paging": f"page {current_page} of {total_pages}",
+            "number_of_pages": str(total_pages),
+            "page_number_in_uploaded_pdf": page_range,
+            "first_page_number": first_page,
+            "destination": destination,
+            "extraction_method": extraction_method,
+            "fallbackUsed": fallback_used
+        })
         if fallback_used:
             result["fallbackReason"] = fallback_reason
             
         return result
     
+    def _extract_page_texts(self, pool: ProcessPoolExecutor) -> List[str]:
+        """Extract the plain text of every page in contiguous page chunks across the pool."""
+        doc = fitz.open(str(self.pdf_path))
+        try:
+            if doc.page_count <= self.workers:
+                return [page.get_text("text", sort=False) for page in doc]
+            page_count = doc.page_count
+        finally:
+            doc.close()
+        
+        # One contiguous chunk per worker so each worker opens the PDF only once
+        chunk = -(-page_count // self.workers)
+        tasks = [(str(self.pdf_path), start, min(start + chunk, page_count))
+                 for start in range(0, page_count, chunk)]
+        page_texts = []
+        for texts in pool.map(_extract_page_range_task, tasks):
+            page_texts.extend(texts)
+        return page_texts
+    
+    def _statement_cache_path(self) -> Path:
+        """Statement cache file for this PDF content, DNM list, and company memory snapshot."""
+        pdf_digest = hashlib.blake2b(digest_size=20)
+        with open(self.pdf_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                pdf_digest.update(block)
+        
+        # Output depends on this code, the parser/scorer versions, the DNM list and stored decisions
+        key = hashlib.blake2b(digest_size=20)
+        key.update(f"{_code_fingerprint()}:{pdf_digest.hexdigest()}:".encode('utf-8'))
+        key.update(json.dumps([self.dnm_companies, self.company_memory], sort_keys=True,
+                              ensure_ascii=False).encode('utf-8'))
+        return self.cache_dir / f"statements_{key.hexdigest()}.json"
+    
     def extract_statements(self) -> List[Dict[str, Any]]:
         """CRITICAL FIX: Extract statements exactly like minimal version - jump to last page."""
+        cache_path = self._statement_cache_path() if self.cache_dir is not None else None
+        if cache_path is not None:
+            try:
+                return json.loads(cache_path.read_bytes())
+            except (OSError, ValueError):
+                pass  # Cache miss - extract and store below
+        
+        statements = list(self.iter_statements())
+        
+        if cache_path is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                tmp_path.write_bytes(_encode_json_line(statements))
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                self.logger.warning("Could not write statement cache %s: %s", cache_path, e)
+        
+        return statements
+    
+    def iter_statements(self) -> Iterator[Dict[str, Any]]:
+        """Yield statements in page order as they are parsed, without the statement cache.
+        
+        With workers=1 pages are read one at a time and each statement is yielded as soon as its last
+        page is parsed, so memory stays flat; pair with save_results(..., output_format="ndjson").
+        With workers > 1 all page text is extracted up front across the pool before the first yield.
+        """
+        if self.workers > 1:
+            # Page text extraction and statement parsing share one pool
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_statement_worker,
+                                     initargs=(self,)) as pool:
+                yield from self._iter_statements_pooled(pool)
+        else:
+            yield from self._iter_statements_serial()
+    
+    def _statement_span(self, page_text: str, page_num: int) -> Optional[Tuple[int, int]]:
+        """(first page, last page) of the statement starting on this page, or None if it is not a start page."""
+        # Inline boundary detection
+        page_match = self.PATTERNS['page'].search(page_text)
+        if not page_match:
+            return None
+        
+        start_pos, end_pos = self._find_boundaries(page_text)
+        if start_pos == -1 or end_pos == -1:
+            return None
+        
+        total_pages = int(page_match.group(2))
+        current_page = int(page_match.group(1))
+        start_page = page_num - (current_page - 1)
+        return start_page, start_page + total_pages - 1
+    
+    def _iter_statements_serial(self) -> Iterator[Dict[str, Any]]:
+        """Single pass over the PDF - reads pages lazily and parses each statement as soon as it is found."""
         doc = fitz.open(str(self.pdf_path))
-        statements = []
+        try:
+            page_count = doc.page_count
+            processed_pages = set()
+            
+            for page_idx in range(page_count):
+                page_num = page_idx + 1
+                if page_num in processed_pages:
+                    continue
+                
+                page_text = doc[page_idx].get_text("text", sort=False)
+                span = self._statement_span(page_text, page_num)
+                if span is None:
+                    continue
+                start_page, last_page_num = span
+                
+                # CRITICAL FIX: Jump to last page like minimal version
+                if last_page_num <= page_count:
+                    if last_page_num != page_num:
+                        page_text = doc[last_page_num - 1].get_text("text", sort=False)
+                    statement_data = self._process_statement(page_text, last_page_num)
+                    if statement_data:
+                        yield statement_data
+                
+                processed_pages.update(range(start_page, last_page_num + 1))
+        finally:
+            doc.close()
+    
+    def _iter_statements_pooled(self, pool: ProcessPoolExecutor) -> Iterator[Dict[str, Any]]:
+        """Find each statement's last page, then process the statements across the pool."""
+        page_texts = self._extract_page_texts(pool)
+        page_count = len(page_texts)
+        tasks = []  # (last page text, last page number) per statement
         processed_pages = set()
         
-        for page_idx in range(len(doc)):
+        for page_idx, page_text in enumerate(page_texts):
             page_num = page_idx + 1
             if page_num in processed_pages:
                 continue
             
-            page_text = doc.load_page(page_idx).get_text()
-            
-            # Inline boundary detection
-            page_match = self.PATTERNS['page'].search(page_text)
-            if not page_match:
-                continue
-            
-            start_pos = min((page_text.find(marker) for marker in self.START_MARKERS if marker in page_text), default=-1)
-            end_pos = page_text.find(self.END_MARKER)
-            if start_pos == -1 or end_pos == -1:
+            span = self._statement_span(page_text, page_num)
+            if span is None:
                 continue
-            
-            total_pages = int(page_match.group(2))
-            current_page = int(page_match.group(1))
-            start_page = page_num - (current_page - 1)
-            last_page_num = start_page + total_pages - 1
+            start_page, last_page_num = span
             
             # CRITICAL FIX: Jump to last page like minimal version
-            if last_page_num <= len(doc):
-                last_page_text = doc.load_page(last_page_num - 1).get_text()
-                statement_data = self._process_statement(last_page_text, last_page_num)
-                
-                if statement_data:
-                    statements.append(statement_data)
+            if last_page_num <= page_count:
+                tasks.append((page_texts[last_page_num - 1], last_page_num))
             
             processed_pages.update(range(start_page, last_page_num + 1))
         
-        doc.close()
-        
+        # Only the last page of each statement is needed from here on
+        del page_texts
         
-        return statements
+        # Statements are independent once their last page is known - fan out across the pool
+        for statement_data in pool.map(_process_statement_task, tasks, chunksize=8):
+            if statement_data:
+                yield statement_data
     
     def process_interactive_questions(self, statements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process interactive questions for companies requiring manual review - asks about each similar company individually."""
@@ -685,72 +999,80 @@ class StatementProcessor:
         
         return statements
     
-    def create_split_pdfs(self, statements: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Split PDF into destination-based files - O(n) operation."""
+    def build_split_pdfs(self, statements: List[Dict[str, Any]]) -> Dict[str, Tuple[bytes, int]]:
+        """Build the destination-based PDFs in memory - returns {destination: (pdf bytes, page count)}."""
         # Group statements by destination - O(n)
-        destinations = {"DNM": [], "Foreign": [], "Natio Single": [], "Natio Multi": []}
+        destinations = {dest: [] for dest in self.SPLIT_PDF_FILES}
         
         for statement in statements:
             dest = statement.get('destination', '').strip()
             if dest in destinations:
                 destinations[dest].append(statement)
         
-        # Create output PDFs
-        output_files = {
-            "DNM": "DNM.pdf",
-            "Foreign": "Foreign.pdf", 
-            "Natio Single": "natioSingle.pdf",
-            "Natio Multi": "natioMulti.pdf"
-        }
-        
         results = {}
         
+        source = fitz.open(str(self.pdf_path))
         try:
-            reader = PdfReader(str(self.pdf_path))
-            total_pages = len(reader.pages)
+            total_pages = len(source)
             
             for dest, statements_list in destinations.items():
                 if not statements_list:
                     continue
                 
-                writer = PdfWriter()
-                pages_added = 0
-                
+                # Collapse pages into consecutive runs so each run is a single insert_pdf copy
+                runs = []
                 for statement in statements_list:
-                    page_range = statement.get('page_number_in_uploaded_pdf', '')
-                    for page_str in page_range.split('-'):
-                        try:
-                            page_num = int(page_str.strip()) - 1  # Convert to 0-based index
-                            if 0 <= page_num < total_pages:
-                                writer.add_page(reader.pages[page_num])
-                                pages_added += 1
-                        except ValueError:
-                            continue
+                    # Statement pages are contiguous: use the integer fields, not the "3-4-5" string
+                    try:
+                        first = int(statement['first_page_number']) - 1  # Convert to 0-based index
+                        last = first + int(statement['number_of_pages']) - 1
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    first, last = max(first, 0), min(last, total_pages - 1)
+                    if first > last:
+                        continue
+                    if runs and runs[-1][1] + 1 == first:
+                        runs[-1][1] = last
+                    else:
+                        runs.append([first, last])
                 
+                pages_added = sum(last - first + 1 for first, last in runs)
                 if pages_added > 0:
-                    output_path = output_files[dest]
-                    with open(output_path, 'wb') as f:
-                        writer.write(f)
-                    results[dest] = pages_added
-                    print(f" Created {output_path} with {pages_added} pages")
+                    writer = fitz.open()
+                    try:
+                        for first, last in runs:
+                            writer.insert_pdf(source, from_page=first, to_page=last)
+                        results[dest] = (writer.tobytes(garbage=4, deflate=True), pages_added)
+                    finally:
+                        writer.close()
+        finally:
+            source.close()
+        
+        return results
+    
+    def create_split_pdfs(self, statements: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Split PDF into destination-based files - O(n) operation."""
+        try:
+            results = {}
+            for dest, (pdf_bytes, pages_added) in self.build_split_pdfs(statements).items():
+                output_path = self.SPLIT_PDF_FILES[dest]
+                Path(output_path).write_bytes(pdf_bytes)
+                results[dest] = pages_added
+                print(f" Created {output_path} with {pages_added} pages")
             
             return results
             
         except Exception as e:
             raise RuntimeError(f"Failed to create split PDFs: {e}")
     
-    def save_results(self, statements: List[Dict[str, Any]], output_path: Optional[str] = None) -> str:
-        """Save processing results to JSON file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = Path(f"output_{timestamp}")
-        output_dir.mkdir(exist_ok=True)
-        
+    def results_json(self, statements: List[Dict[str, Any]]) -> bytes:
+        """Serialize statements into the results JSON payload as UTF-8 bytes."""
         # Clean up internal logging data
         for statement in statements:
             if '_extraction_log' in statement:
                 del statement['_extraction_log']
         
-        # Save clean JSON for API consumers
+        # Clean JSON structure for API consumers
         data = {
             "dnm_companies": self.dnm_companies,
             "extracted_statements": statements,
@@ -758,14 +1080,47 @@ class StatementProcessor:
             "processing_timestamp": datetime.now().isoformat()
         }
         
-        json_path = output_dir / "results.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # orjson emits UTF-8 with the same 2-space layout, encoded in native code
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def save_results(self, statements: Iterable[Dict[str, Any]], output_path: Optional[str] = None,
+                     output_format: str = "json") -> str:
+        """Save processing results to a JSON file, or an NDJSON file with one statement per line."""
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = Path(f"output_{timestamp}")
+        output_dir.mkdir(exist_ok=True)
+        
+        if output_format == "ndjson":
+            json_path = output_dir / "results.ndjson"
+            with open(json_path, 'wb') as f:
+                for statement in statements:
+                    statement.pop('_extraction_log', None)
+                    f.write(_encode_json_line(statement))
+        else:
+            json_path = output_dir / "results.json"
+            json_path.write_bytes(self.results_json(list(statements)))
         
         print(f" Results saved to {json_path}")
         return str(json_path)
     
-    def run_complete_workflow(self, skip_questions: bool = False) -> bool:
+    @staticmethod
+    def _tally_statements(statements: Iterable[Dict[str, Any]], flags: Counter,
+                          methods: Counter) -> Iterator[Dict[str, Any]]:
+        """Pass statements through unchanged while counting review flags and extraction methods."""
+        for statement in statements:
+            methods[statement.get('extraction_method', 'unknown')] += 1
+            if statement.get('manual_required', False):
+                flags['manual_required'] += 1
+            if statement.get('ask_question', False):
+                flags['ask_question'] += 1
+            yield statement
+    
+    def run_complete_workflow(self, skip_questions: bool = False, output_format: str = "json") -> bool:
         """Execute the complete statement processing workflow."""
         try:
             print("=" * 60)
@@ -774,10 +1129,14 @@ class StatementProcessor:
             print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print()
             
-            # Step 1: Extract statements
+            # Step 1: Extract statements - comparison runs to NDJSON never need the full list
             print(" Step 1: Extracting statements from PDF...")
-            statements = self.extract_statements()
-            print(f" Extracted {len(statements)} statements")
+            if skip_questions and output_format == "ndjson":
+                statements = self.iter_statements()
+                print(" Streaming statements straight to the results file")
+            else:
+                statements = self.extract_statements()
+                print(f" Extracted {len(statements)} statements")
             
             # Step 2: Process interactive questions (skip if requested)
             if not skip_questions:
@@ -790,7 +1149,11 @@ class StatementProcessor:
             
             # Step 3: Save results
             print("\n Step 3: Saving results...")
-            output_file = self.save_results(statements)
+            flags, methods = Counter(), Counter()
+            if skip_questions:
+                # Count summary figures while the statements are written - one pass, works when streaming
+                statements = self._tally_statements(statements, flags, methods)
+            output_file = self.save_results(statements, output_format=output_format)
             print(" Results saved")
             
             if not skip_questions:
@@ -815,12 +1178,12 @@ class StatementProcessor:
                 print(" EXTRACTION COMPLETED FOR COMPARISON")
                 print("=" * 60)
                 
-                manual_count = sum(1 for s in statements if s.get('manual_required', False))
-                ask_count = sum(1 for s in statements if s.get('ask_question', False))
-                
-                print(f"Total statements processed: {len(statements)}")
-                print(f"Manual review required: {manual_count}")
-                print(f"Ask question required: {ask_count}")
+                print(f"Total statements processed: {sum(methods.values())}")
+                print(f"Manual review required: {flags['manual_required']}")
+                print(f"Ask question required: {flags['ask_question']}")
+                print("Extraction methods used:")
+                for method, count in methods.most_common():
+                    print(f"  • {method}: {count}")
                 print(f"JSON output: {output_file}")
             
             print(f"\nCompleted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -874,19 +1237,61 @@ def get_file_paths() -> Tuple[str, str]:
     return pdf_path, excel_path
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for the statement processor."""
+    parser = argparse.ArgumentParser(description="Professional Statement Processing System")
+    parser.add_argument("pdf_path", nargs="?", default=os.environ.get("STMT_PDF"),
+                        help="statements PDF (default: $STMT_PDF, else prompt)")
+    parser.add_argument("excel_path", nargs="?", default=os.environ.get("STMT_EXCEL"),
+                        help="DNM Excel workbook (default: $STMT_EXCEL, else prompt)")
+    parser.add_argument("--skip-questions", action="store_true",
+                        help="skip interactive questions and split PDFs (comparison mode)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for page extraction and matching (default: 1)")
+    parser.add_argument("--output-format", choices=StatementProcessor.OUTPUT_FORMATS, default="json",
+                        help="results file format (default: json)")
+    parser.add_argument("--cache-dir", default=os.environ.get("STATEMENT_CACHE_DIR"),
+                        help="directory for DNM and statement caches (default: $STATEMENT_CACHE_DIR)")
+    args = parser.parse_args(argv)
+    
+    # Half a pair would otherwise be dropped in favour of prompting for both files
+    if bool(args.pdf_path) != bool(args.excel_path):
+        parser.error("pdf_path and excel_path (or $STMT_PDF and $STMT_EXCEL) must be given together, "
+                     "or neither to pick the files interactively")
+    return args
+
+
 def main() -> int:
     """Main entry point for the statement processor."""
+    args = parse_args()
+    
+    # Library code logs through self.logger; LOGLEVEL=INFO surfaces memory auto-decisions
+    level_name = (os.environ.get("LOGLEVEL") or "WARNING").strip().upper()
+    level = logging.getLevelName(level_name)  # int for known names, "Level X" string otherwise
+    logging.basicConfig(level=level if isinstance(level, int) else logging.WARNING,
+                        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    if not isinstance(level, int):
+        logging.getLogger(__name__).warning("Unknown LOGLEVEL %r, using WARNING", level_name)
+    
+    faulthandler.enable()
+    # Extraction allocates many short-lived strings and dicts - run generation-0 collections less often
+    gc.set_threshold(50_000, 10, 10)
+    
     try:
         print("Professional Statement Processing System v2.0")
         print("=" * 50)
         
-        # Get file paths
-        pdf_path, excel_path = get_file_paths()
+        # Get file paths - prompt only when they were not given on the command line or environment
+        if args.pdf_path and args.excel_path:
+            pdf_path, excel_path = args.pdf_path, args.excel_path
+        else:
+            pdf_path, excel_path = get_file_paths()
         
         # Create and run processor
-        processor = StatementProcessor(pdf_path, excel_path)
-        skip_questions = '--skip-questions' in sys.argv
-        success = processor.run_complete_workflow(skip_questions)
+        processor = StatementProcessor(pdf_path, excel_path, workers=args.workers, cache_dir=args.cache_dir)
+        # DNM list, match index and patterns live for the whole run - keep them out of future GC scans
+        gc.freeze()
+        success = processor.run_complete_workflow(args.skip_questions, args.output_format)
         
         return 0 if success else 1
         
@@ -1,20 +1,37 @@
 #!/usr/bin/env python3
 """
 Quick Start Script for Frontend Demo
-Automatically opens browser to http://localhost:3000
+Automatically opens browser to http://localhost:$FRONTEND_PORT (default 3000)
 """
 
 import os
+import socket
 import subprocess
 import sys
 import webbrowser
 import time
-from threading import Timer
+from threading import Thread
+
+FRONTEND_PORT = int(os.environ.get('FRONTEND_PORT', 3000))  # same variable frontend_demo.py serves on
+STARTUP_TIMEOUT = 10.0  # seconds to wait for the server to accept connections
+POLL_INTERVAL = 0.1
+
+def wait_for_server(port, timeout=STARTUP_TIMEOUT):
+    """Poll the local port until the server accepts a connection or the deadline passes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('localhost', port), timeout=POLL_INTERVAL):
+                return True
+        except OSError:
+            time.sleep(POLL_INTERVAL)
+    return False
 
 def open_browser():
-    """Open browser after a short delay"""
-    time.sleep(2)  # Wait for server to start
-    webbrowser.open('http://localhost:3000')
+    """Open browser as soon as the server is ready"""
+    if not wait_for_server(FRONTEND_PORT):
+        print(f"Frontend not reachable on port {FRONTEND_PORT} after {STARTUP_TIMEOUT:.0f}s - opening browser anyway")
+    webbrowser.open(f'http://localhost:{FRONTEND_PORT}')
 
 def main():
     # Always use the fixed Railway URL
@@ -24,11 +41,11 @@ def main():
     os.environ['API_URL'] = railway_url
     
     print(f"\nStarting frontend demo with API: {railway_url}")
-    print("Opening browser to: http://localhost:3000")
+    print(f"Opening browser to: http://localhost:{FRONTEND_PORT}")
     print("Press Ctrl+C to stop the frontend server")
     
-    # Schedule browser opening
-    Timer(2.0, open_browser).start()
+    # Open the browser once the server is accepting connections
+    Thread(target=open_browser, daemon=True).start()
     
     # Run the frontend demo
     try: